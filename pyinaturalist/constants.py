@@ -24,6 +24,7 @@ KEYRING_KEY = '/inaturalist'
 # Pagination settings
 PER_PAGE_RESULTS = 200  # Default number of records per page for paginated queries
 LARGE_REQUEST_WARNING = 5000  # Show a warning for queries that will return over this many results
+MAX_PARALLEL_REQUESTS = 4  # Max number of concurrent requests for 'page-parallel' pagination
 
 # Rate-limiting and retry settings
 CONNECT_TIMEOUT = 5
@@ -2,6 +2,7 @@ from pyinaturalist.controllers import BaseController
 from pyinaturalist.docs import document_controller_params
 from pyinaturalist.models import Taxon
 from pyinaturalist.paginator import Paginator
+from pyinaturalist.request_params import convert_rank_range
 from pyinaturalist.v1 import get_taxa, get_taxa_autocomplete, get_taxa_by_id
 
 
@@ -22,4 +23,6 @@ class TaxonController(BaseController):
 
     @document_controller_params(get_taxa)
     def search(self, **params) -> Paginator[Taxon]:
+        # Translate rank range once here, instead of separately for each page
+        params = convert_rank_range(params)
         return self.client.paginate(get_taxa, Taxon, **params)
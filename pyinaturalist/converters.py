@@ -1,6 +1,7 @@
 """Type conversion utilities used for both requests and responses"""
 import re
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from io import BytesIO
 from logging import getLogger
 from os.path import abspath, expanduser
@@ -9,9 +10,10 @@ from typing import IO, Any, Dict, List, Mapping, MutableSequence, Optional, Unio
 from warnings import catch_warnings, simplefilter
 
 from dateutil.parser import UnknownTimezoneWarning  # type: ignore  # (missing from type stubs)
+from dateutil.parser import isoparse
 from dateutil.parser import parse as parse_date
-from dateutil.tz import tzlocal, tzoffset
-from requests import Session
+from dateutil.tz import tzlocal, tzoffset, tzutc
+from requests import Response, Session
 
 from pyinaturalist.constants import (
     AnyFile,
@@ -33,6 +35,12 @@ OBSERVATION_TIME_FIELDS = (
     'time_zone_offset',
 )
 
+# orjson is optional, but can decode large responses significantly faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Extremely simplified URL regex, just enough to differentiate from local paths
 URL_PATTERN = re.compile(r'^https?://.+')
 
@@ -86,6 +94,20 @@ def convert_histogram(result: JsonResponse, interval: str):
         return {parse_date(k): v for k, v in result.items()}
 
 
+def decode_json(response: Response) -> JsonResponse:
+    """Decode a JSON response body, using orjson if installed. Falls back to
+    :py:meth:`requests.Response.json` otherwise, or if the response body isn't available as bytes
+    (e.g., in dry-run mode).
+
+    **Note:** This decodes the raw response bytes directly, which skips the intermediate ``str``
+    copy of the body that :py:meth:`requests.Response.json` creates. Streaming the response
+    wouldn't reduce memory usage any further, since the full body is still read for caching.
+    """
+    if orjson is None or not isinstance(response.content, bytes):
+        return response.json()
+    return orjson.loads(response.content)
+
+
 # Type conversion functions for individual results or values
 # --------------------
 
@@ -147,7 +169,7 @@ def convert_lat_long_list(result: ResponseResult):
 def convert_generic_timestamps(result: ResponseResult) -> ResponseResult:
     """Replace generic created/updated info that's returned by multiple endpoints.
     **Note:** Compared to observation timestamps, these are generally more reliable. These seem to
-    be consistently in ISO 8601 format.
+    be consistently in ISO 8601 format, which :py:func:`.try_datetime` can parse quickly.
     """
     if not result:
         return result
@@ -176,12 +198,14 @@ def convert_observation_timestamps(result: ResponseResult) -> ResponseResult:
 
     created_datetime = observation.get('created_at')
     if not isinstance(created_datetime, datetime):
-        created_datetime = try_datetime(observation.get('created_at_details', {}).get('date'))
-        created_datetime = convert_offset(created_datetime, tz_offset, tz_name)
+        created_datetime = convert_observation_timestamp(
+            observation.get('created_at_details', {}).get('date'), tz_offset, tz_name
+        )
 
     # Ignore any timezone info in observed_on timestamp; offset field is more reliable
-    observed_datetime = try_datetime(observation.get('observed_on_string', ''), ignoretz=True)
-    observed_datetime = convert_offset(observed_datetime, tz_offset, tz_name)
+    observed_datetime = convert_observation_timestamp(
+        observation.get('observed_on_string', ''), tz_offset, tz_name, ignoretz=True
+    )
 
     # If valid, add the datetime objects and remove all other redundant date/time fields
     if created_datetime and observed_datetime:
@@ -218,9 +242,10 @@ def convert_offset(
         return None
 
 
+@lru_cache(maxsize=256)
 def parse_offset(tz_offset: str, tz_name: str = None) -> tzoffset:
     """Convert a timezone offset string to a tzoffset object, accounting for some common variations
-    in format
+    in format. Results are cached, since the same few offsets tend to be repeated across results.
 
     Examples:
 
@@ -345,11 +370,19 @@ def format_license(value: str) -> Optional[str]:
 
 
 def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
-    """Parse a timestamp string into a datetime, if valid; return ``None`` otherwise"""
+    """Parse a timestamp string into a datetime, if valid; return ``None`` otherwise.
+
+    Most timestamps are in ISO 8601 format, so a (much faster) ISO parser is tried first, before
+    falling back to :py:func:`dateutil.parser.parse` for other formats.
+    """
     if isinstance(timestamp, datetime):
         return timestamp
     if not timestamp or not str(timestamp).strip():
         return None
+    if isinstance(timestamp, str) and not kwargs.keys() - {'ignoretz'}:
+        dt = _try_isoformat(timestamp, **kwargs)
+        if dt:
+            return dt
 
     try:
         # Suppress UnknownTimezoneWarning
@@ -361,6 +394,34 @@ def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
         return None
 
 
+def _try_isoformat(timestamp: str, ignoretz: bool = False) -> Optional[datetime]:
+    """Parse a timestamp string in ISO 8601 format into a datetime, if valid; return ``None``
+    otherwise. Uses :py:meth:`datetime.fromisoformat` if possible, and falls back to
+    :py:func:`dateutil.parser.isoparse` for variations that it doesn't support.
+
+    Reduced-precision dates (like ``'2020-09'``) are left to :py:func:`dateutil.parser.parse`,
+    which fills in missing date parts differently than ``isoparse``. Timezones are converted to
+    :py:mod:`dateutil.tz` types, to match the results of ``parse``.
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
+        if len(timestamp) < 10:
+            return None
+        try:
+            dt = isoparse(timestamp)
+        except (OverflowError, ValueError):
+            return None
+
+    if ignoretz:
+        return dt.replace(tzinfo=None)
+    if isinstance(dt.tzinfo, timezone):
+        offset = dt.utcoffset()
+        tz = tzoffset(None, int(offset.total_seconds())) if offset else tzutc()
+        dt = dt.replace(tzinfo=tz)
+    return dt
+
+
 def try_float(value: Any) -> Optional[float]:
     """Convert a value to a float, if valid; return ``None`` otherwise"""
     try:
@@ -12,5 +12,4 @@ from pyinaturalist.docs.signatures import (
     document_common_args,
     document_controller_params,
     document_request_params,
-    extend_init_signature,
 )
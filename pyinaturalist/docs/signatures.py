@@ -2,7 +2,7 @@
 from functools import partial
 from inspect import Parameter, ismethod, signature
 from logging import getLogger
-from typing import Callable, Dict, Iterable, List, Type
+from typing import Callable, Dict, Iterable, List
 
 import forge
 from requests import Session
@@ -11,7 +11,6 @@ from pyinaturalist.constants import TemplateFunction
 from pyinaturalist.converters import ensure_list
 from pyinaturalist.docs import copy_annotations, copy_docstrings
 
-AUTOMETHOD_INIT = '.. automethod:: __init__'
 CONTROLLER_EXCLUDE_PARAMS = ['dry_run', 'session', 'page', 'per_page', 'order', 'count_only']
 
 logger = getLogger(__name__)
@@ -95,25 +94,6 @@ def document_common_args(func):
     return func
 
 
-def extend_init_signature(*template_functions: Callable) -> Callable:
-    """A class decorator that behaves like :py:func:`.copy_doc_signature`, but modifies a class
-    docstring and its ``__init__`` function signature, and extends them instead of replacing them.
-    """
-
-    def wrapper(target_class: Type):
-        # Modify init signature + docstring
-        revision = copy_doc_signature(*template_functions, target_class.__init__)
-        target_class.__init__ = revision(target_class.__init__)
-
-        # Include init docs in class docs
-        target_class.__doc__ = target_class.__doc__ or ''
-        if AUTOMETHOD_INIT not in target_class.__doc__:
-            target_class.__doc__ += f'\n\n    {AUTOMETHOD_INIT}\n'
-        return target_class
-
-    return wrapper
-
-
 def copy_signatures(
     target_function: Callable,
     template_functions: List[TemplateFunction],
@@ -11,7 +11,13 @@ from attr import define, validators
 
 from pyinaturalist.constants import JsonResponse, ResponseOrResults
 from pyinaturalist.converters import convert_lat_long, try_datetime
-from pyinaturalist.models.base import BaseModel, BaseModelCollection, T, load_json
+from pyinaturalist.models.base import (
+    BaseModel,
+    BaseModelCollection,
+    T,
+    is_model_object_or_list,
+    load_json,
+)
 from pyinaturalist.models.lazy_property import LazyProperty, add_lazy_attrs, get_lazy_properties
 
 
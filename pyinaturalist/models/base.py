@@ -3,10 +3,11 @@ import json
 from collections import UserList
 from copy import deepcopy
 from datetime import datetime
+from itertools import islice
 from logging import getLogger
 from os.path import expanduser
 from pathlib import Path
-from typing import Dict, Generic, List, Type, TypeVar
+from typing import Dict, Generic, List, Sequence, Type, TypeVar
 
 from attr import Factory, asdict, define, field, fields_dict
 
@@ -29,7 +30,10 @@ class BaseModel:
     """Base class for data models"""
 
     id: int = field(default=None, metadata={'doc': 'Unique record ID'})
-    temp_attrs: List[str] = []
+    # Lazy-loaded attributes that will share a single object per unique ID in from_json_list()
+    shared_attrs: List[str] = []
+    # Lazy-loaded list attributes that will be converted for all objects at once in from_json_list()
+    batch_attrs: List[str] = []
 
     @classmethod
     def copy(cls, obj: 'BaseModel') -> 'BaseModel':
@@ -53,7 +57,7 @@ class BaseModel:
         cls_attrs = {k.lstrip('_'): v for k, v in fields_dict(cls).items()}
 
         def is_valid_attr(k):
-            return (k in cls_attrs and cls_attrs[k].init is True) or k in cls.temp_attrs
+            return k in cls_attrs and cls_attrs[k].init is True
 
         valid_json = {k: v for k, v in value.items() if is_valid_attr(k) and v is not None}
         return cls(**valid_json, **kwargs)
@@ -65,8 +69,18 @@ class BaseModel:
 
     @classmethod
     def from_json_list(cls: Type[T], value: ResponseOrResults) -> List[T]:
-        """Initialize a collection of model objects from an API response or response results"""
-        return [cls.from_json(item) for item in ensure_list(value)]
+        """Initialize a collection of model objects from an API response or response results.
+
+        For any ``shared_attrs``, nested records with the same ID will be converted into a single
+        object, which is shared by all model objects in the collection. For any ``batch_attrs``,
+        nested lists of records will be converted for all model objects with a single call.
+        """
+        objs = [cls.from_json(item) for item in ensure_list(value)]
+        for name in cls.shared_attrs:
+            _convert_shared(objs, getattr(cls, name))
+        for name in cls.batch_attrs:
+            _batch_convert(objs, getattr(cls, name))
+        return objs
 
     @property
     def row(self) -> TableRow:
@@ -165,6 +179,47 @@ class BaseModelCollection(BaseModel, UserList, Generic[T]):
         return '\n'.join([str(obj) for obj in self.data])
 
 
+# TODO: Make this more generic by looking for converter function return type instead of BaseModel?
+def is_model_object_or_list(value) -> bool:
+    """Determine if a value is a model object, or a list of model objects"""
+    try:
+        return isinstance(value, BaseModel) or isinstance(value[0], BaseModel)
+    except (AttributeError, KeyError, TypeError):
+        return False
+
+
+def _batch_convert(objs: Sequence[BaseModel], prop):
+    """Convert a nested list of records for all objects with a single call to a LazyProperty's
+    ``from_json_list`` converter, and store the results in the temp attribute for each object
+    """
+    pending = [(obj, getattr(obj, prop.temp_attr)) for obj in objs]
+    pending = [
+        (obj, value) for obj, value in pending if value and not is_model_object_or_list(value)
+    ]
+
+    converted = iter(prop.converter([item for _, values in pending for item in values]))
+    for obj, values in pending:
+        setattr(obj, prop.temp_attr, list(islice(converted, len(values))))
+
+
+def _convert_shared(objs: Sequence[BaseModel], prop):
+    """Convert a nested record for each object with a LazyProperty's converter, using one shared
+    model object per unique ID
+    """
+    shared: Dict[int, BaseModel] = {}
+    for obj in objs:
+        value = getattr(obj, prop.temp_attr)
+        if not value or not isinstance(value, dict):
+            continue
+        record_id = value.get('id')
+        if record_id is None:
+            setattr(obj, prop.temp_attr, prop.converter(value))
+            continue
+        if record_id not in shared:
+            shared[record_id] = prop.converter(value)
+        setattr(obj, prop.temp_attr, shared[record_id])
+
+
 def load_json(value: ResponseOrFile) -> ResponseOrResults:
     """Load a JSON string, file path, or file-like object"""
     if not value:
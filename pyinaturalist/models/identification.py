@@ -43,6 +43,7 @@ class Identification(BaseModel):
     user: property = LazyProperty(
         User.from_json, type=User, doc='User that added the indentification'
     )
+    shared_attrs = ['taxon', 'user']
 
     # Unused attributes
     # created_at_details: {}
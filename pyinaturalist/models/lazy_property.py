@@ -4,7 +4,7 @@ from typing import Callable, Dict, List, Type
 
 from attr import Attribute, Factory
 
-from pyinaturalist.models import BaseModel
+from pyinaturalist.models import BaseModel, is_model_object_or_list
 
 FIELD_DEFAULTS = {
     'default': None,
@@ -77,7 +77,7 @@ class LazyProperty(property):
             return self
 
         value = getattr(obj, self.temp_attr)
-        if value and not _is_model_object_or_list(value):
+        if value and not is_model_object_or_list(value):
             value = self.converter(value)
             setattr(obj, self.temp_attr, value)
         return value
@@ -114,14 +114,6 @@ def make_attribute(name, **kwargs):
     return Attribute(name=name, **kwargs)
 
 
-# TODO: Make this more generic by looking for converter function return type instead of BaseModel?
-def _is_model_object_or_list(value):
-    try:
-        return isinstance(value, BaseModel) or isinstance(value[0], BaseModel)
-    except (AttributeError, KeyError, TypeError):
-        return False
-
-
 def _returns_list(func: Callable) -> bool:
     """Determine if a function is annotated with a List return type"""
     return_type = signature(func).return_annotation
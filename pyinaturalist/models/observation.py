@@ -2,8 +2,6 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from attr import define
-
 from pyinaturalist.constants import (
     ALL_LICENSES,
     DATETIME_SHORT_FORMAT,
@@ -12,10 +10,10 @@ from pyinaturalist.constants import (
     QUALITY_GRADES,
     Coordinates,
     DateTime,
+    JsonResponse,
     TableRow,
 )
 from pyinaturalist.converters import convert_observation_timestamp
-from pyinaturalist.docs import extend_init_signature
 from pyinaturalist.models import (
     Annotation,
     BaseModel,
@@ -28,17 +26,17 @@ from pyinaturalist.models import (
     ProjectObservation,
     Taxon,
     User,
-    add_lazy_attrs,
     coordinate_pair,
     datetime_field,
     datetime_now_field,
+    define_model,
     define_model_collection,
     field,
     upper,
 )
 
 
-@define(auto_attribs=False, init=False, field_transformer=add_lazy_attrs)
+@define_model
 class Observation(BaseModel):
     """:fa:`binoculars` An observation, based the schema of
     :v1:`GET /observations <Observations/get_observations>`
@@ -167,6 +165,8 @@ class Observation(BaseModel):
     )
     taxon: property = LazyProperty(Taxon.from_json, type=Taxon, doc='Observation taxon')
     user: property = LazyProperty(User.from_json, type=User, doc='Observer')
+    shared_attrs = ['taxon', 'user']
+    batch_attrs = ['identifications', 'photos']
 
     # Additional attributes from API response that aren't needed; just left here for reference
     # cached_votes_total: int = field(default=None)
@@ -187,43 +187,36 @@ class Observation(BaseModel):
     # time_observed_at: DateTime = datetime_attr
     # time_zone_offset: str = field(default=None)
 
-    # Attributes that will only be used during init and then omitted
-    temp_attrs = [
-        'created_at_details',
-        'observed_on_string',
-        'observed_time_zone',
-        'time_zone_offset',
-    ]
+    def __attrs_post_init__(self):
+        # If there's no URL, make one based on ID
+        self.uri = self.uri or f'{INAT_BASE_URL}/observations/{self.id or ""}'
 
-    # Convert observation timestamps prior to __attrs_init__
-    def __init__(
-        self,
-        # created_at_details: Dict = None,
-        # observed_on_string: str = None,
-        # observed_time_zone: str = None,
-        # time_zone_offset: str = None,
-        **kwargs,
-    ):
-        created_at_details = kwargs.pop('created_at_details', None)
-        observed_on_string = kwargs.pop('observed_on_string', None)
-        observed_time_zone = kwargs.pop('observed_time_zone', None)
-        time_zone_offset = kwargs.pop('time_zone_offset', None)
+    @classmethod
+    def from_json(cls, value: JsonResponse, **kwargs) -> 'Observation':
+        """Convert observation timestamps using timezone info before initializing"""
+        value = value or {}
+        if isinstance(value, cls):
+            return value
 
-        tz_offset = time_zone_offset
-        tz_name = observed_time_zone
-        created_date = (created_at_details or {}).get('date')
+        tz_offset = value.get('time_zone_offset')
+        tz_name = value.get('observed_time_zone')
+        created_date = (value.get('created_at_details') or {}).get('date')
+        observed_on_string = value.get('observed_on_string')
 
-        if not isinstance(kwargs.get('created_at'), datetime) and created_date:
-            kwargs['created_at'] = convert_observation_timestamp(created_date, tz_offset, tz_name)
-        if not isinstance(kwargs.get('observed_on'), datetime) and observed_on_string:
-            kwargs['observed_on'] = convert_observation_timestamp(
+        converted = {}
+        if created_date and not isinstance(value.get('created_at'), datetime):
+            converted['created_at'] = convert_observation_timestamp(
+                created_date, tz_offset, tz_name
+            )
+        if observed_on_string and not isinstance(value.get('observed_on'), datetime):
+            converted['observed_on'] = convert_observation_timestamp(
                 observed_on_string, tz_offset, tz_name, ignoretz=True
             )
 
-        if not kwargs.get('uri'):
-            kwargs['uri'] = f'{INAT_BASE_URL}/observations/{kwargs.get("id", "")}'
-
-        self.__attrs_init__(**kwargs)  # type: ignore
+        # Copy once (if needed) to avoid modifying the original response
+        if converted:
+            value = {**value, **converted}
+        return super(Observation, cls).from_json(value, **kwargs)
 
     @classmethod
     def from_id(cls, id: int):
@@ -294,7 +287,3 @@ class Observations(BaseModelCollection):
     def thumbnail_urls(self) -> List[str]:
         """Get thumbnails for all observation default photos"""
         return [obs.thumbnail_url for obs in self.data if obs.thumbnail_url]
-
-
-# Fix __init__ and class docstring
-Observation = extend_init_signature(Observation.__attrs_init__)(Observation)  # type: ignore
@@ -83,11 +83,13 @@ class ObservationFieldValue(BaseModel):
     # name_ci: str = field(default=None)
     # value_ci: int = field(default=None)
 
-    # Convert value by datatype
+    # Convert value by datatype, and skip lazy-loading for empty nested records
     def __attrs_post_init__(self):
-        if self.datatype in OFV_DATATYPES and self.value is not None:
-            converter = OFV_DATATYPES[self.datatype]
+        converter = OFV_DATATYPES.get(self.datatype)
+        if converter and self.value is not None:
             self.value = converter(self.value)
+        self._taxon = self._taxon or None
+        self._user = self._user or None
 
     @property
     def row(self) -> TableRow:
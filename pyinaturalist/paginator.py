@@ -18,12 +18,14 @@ from requests import Response
 from pyinaturalist.constants import (
     EXPORT_URL,
     LARGE_REQUEST_WARNING,
+    MAX_PARALLEL_REQUESTS,
     PER_PAGE_RESULTS,
     REQUESTS_PER_MINUTE,
     IntOrStr,
     JsonResponse,
     ResponseResult,
 )
+from pyinaturalist.converters import decode_json
 from pyinaturalist.models import T
 
 logger = getLogger(__name__)
@@ -36,7 +38,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
     Args:
         request_function: API request function to paginate
         model: Model class to use for results
-        method: Pagination method; either 'page' or 'id' (see note below)
+        method: Pagination method; either 'page', 'page-parallel', or 'id' (see notes below)
         limit: Maximum number of results to fetch
         per_page: Maximum number of results to fetch per page
         kwargs: Original request parameters
@@ -49,6 +51,12 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         when retrieving records from large result sets. If you need to retrieve large numbers of
         records, use the ``per_page`` and ``id_above`` or ``id_below`` parameters instead.*
 
+    .. note::
+        With ``method='page-parallel'``, the first page is fetched normally to get the total number
+        of results, and then all remaining pages are fetched concurrently. Each thread uses its own
+        session (see :py:func:`.get_local_session`). Rate-limiting still applies to these requests,
+        since rate limits are tracked across all threads.
+
     """
 
     def __init__(
@@ -79,7 +87,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         if self.method == 'id':
             self.kwargs['order_by'] = 'id'
             self.kwargs['order'] = 'asc'
-        elif self.method == 'page':
+        elif self.method in ['page', 'page-parallel']:
             self.kwargs['page'] = 1
 
         logger.debug(
@@ -91,8 +99,9 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         """Iterate over paginated results, with non-blocking requests sent from a separate thread"""
         with ThreadPoolExecutor(max_workers=1) as executor:
             while not self.exhausted:
-                for result in executor.submit(self.next_page).result():
-                    yield self.model.from_json(result)
+                results = executor.submit(self.next_page).result()
+                for result in self.model.from_json_list(results):
+                    yield result
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over paginated results"""
@@ -134,15 +143,15 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         """Get the next page of results"""
         if self.exhausted:
             return []
+        if self.method == 'page-parallel' and self.results_fetched > 0:
+            return self._next_pages_parallel()
 
         # If a limit is specified, avoid fetching more results than needed
         if self.limit and self.results_fetched + self.per_page > self.limit:
             self.per_page = self.limit - self.results_fetched
 
-        # Fetch results; handle response object or dict
-        response = self.request_function(*self.request_args, **self.kwargs, per_page=self.per_page)
-        if isinstance(response, Response):
-            response = response.json()
+        # Fetch results
+        response = self._get_page(self.kwargs)
         results = response.get('results', response)
 
         # Note: For id-based pagination, only the first page's 'total_results' is accurate
@@ -157,6 +166,35 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
         return results
 
+    def _get_page(self, kwargs) -> JsonResponse:
+        """Send a request for a single page of results; handle response object or dict"""
+        response = self.request_function(*self.request_args, **kwargs, per_page=self.per_page)
+        if isinstance(response, Response):
+            response = decode_json(response)
+        return response
+
+    def _next_pages_parallel(self) -> List[ResponseResult]:
+        """Get all remaining pages of results, with requests sent concurrently from separate
+        threads. Results are returned in page order, as a single list.
+        """
+        total_results = self.total_results or 0
+        if self.limit:
+            total_results = min(total_results, self.limit)
+        last_page = ceil(total_results / self.per_page)
+        all_page_kwargs = [
+            {**self.kwargs, 'page': page} for page in range(self.kwargs['page'], last_page + 1)
+        ]
+
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+            responses = executor.map(self._get_page, all_page_kwargs)
+            results = [result for response in responses for result in response.get('results', [])]
+
+        if self.limit:
+            results = results[: self.limit - self.results_fetched]
+        self.results_fetched += len(results)
+        self.exhausted = True
+        return results
+
     def _check_exhausted(self):
         return (
             (self.limit and self.results_fetched >= self.limit)
@@ -172,7 +210,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
             self.exhausted = True
         elif self.method == 'id':
             self.kwargs['id_above'] = page_results[-1]['id']
-        elif self.method == 'page':
+        elif self.method in ['page', 'page-parallel']:
             self.kwargs['page'] += 1
 
     def _estimate(self):
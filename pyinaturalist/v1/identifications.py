@@ -1,5 +1,5 @@
 from pyinaturalist.constants import JsonResponse, MultiInt
-from pyinaturalist.converters import convert_all_timestamps
+from pyinaturalist.converters import convert_all_timestamps, decode_json
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.paginator import paginate_all
@@ -29,7 +29,7 @@ def get_identifications_by_id(identification_id: MultiInt, **params) -> JsonResp
         Response dict containing identification records
     """
     response = get_v1('identifications', ids=identification_id, **params)
-    identifications = response.json()
+    identifications = decode_json(response)
     identifications['results'] = convert_all_timestamps(identifications['results'])
     return identifications
 
@@ -62,9 +62,9 @@ def get_identifications(**params) -> JsonResponse:
     """
     params = convert_rank_range(params)
     if params.get('page') == 'all':
-        identifications = paginate_all(get_v1, 'identifications', **params)
+        identifications = paginate_all(get_v1, 'identifications', method='page-parallel', **params)
     else:
-        identifications = get_v1('identifications', **params).json()
+        identifications = decode_json(get_v1('identifications', **params))
 
     identifications['results'] = convert_all_timestamps(identifications['results'])
     return identifications
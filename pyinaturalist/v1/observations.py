@@ -16,6 +16,7 @@ from pyinaturalist.converters import (
     convert_histogram,
     convert_observation_histogram,
     convert_observation_timestamps,
+    decode_json,
     ensure_list,
 )
 from pyinaturalist.docs import document_common_args, document_request_params
@@ -155,7 +156,7 @@ def get_observations(**params) -> JsonResponse:
     if params.get('page') == 'all':
         observations = paginate_all(get_v1, 'observations', method='id', **params)
     else:
-        observations = get_v1('observations', **params).json()
+        observations = decode_json(get_v1('observations', **params))
 
     observations['results'] = convert_all_coordinates(observations['results'])
     observations['results'] = convert_all_timestamps(observations['results'])
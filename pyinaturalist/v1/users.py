@@ -1,7 +1,7 @@
 from logging import getLogger
 
 from pyinaturalist.constants import IntOrStr, JsonResponse
-from pyinaturalist.converters import convert_all_timestamps, convert_generic_timestamps
+from pyinaturalist.converters import convert_all_timestamps, convert_generic_timestamps, decode_json
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.v1 import get_v1
@@ -33,7 +33,7 @@ def get_user_by_id(user_id: IntOrStr, **params) -> JsonResponse:
         Response dict containing user record
     """
     response = get_v1('users', ids=user_id, allow_str_ids=True, **params)
-    results = response.json()['results']
+    results = decode_json(response)['results']
     if not results:
         return {}
     return convert_generic_timestamps(results[0])
@@ -63,6 +63,6 @@ def get_users_autocomplete(q: str, **params) -> JsonResponse:
         Response dict containing user records
     """
     response = get_v1('users/autocomplete', q=q, **params)
-    users = response.json()
+    users = decode_json(response)
     users['results'] = convert_all_timestamps(users['results'])
     return users
@@ -42,3 +42,17 @@ def test_search(requests_mock):
     results = client.taxa.search(q='vespi', rank=['genus', 'subgenus', 'species']).all()
     assert len(results) == 30 and isinstance(results[0], Taxon)
     assert results[0].id == 70118
+
+
+def test_search__rank_range(requests_mock):
+    requests_mock.get(
+        f'{API_V1_BASE_URL}/taxa',
+        json=SAMPLE_DATA['get_taxa'],
+        status_code=200,
+    )
+
+    client = iNatClient()
+    paginator = client.taxa.search(q='vespi', min_rank='species', max_rank='genus')
+    assert paginator.kwargs['rank'] == ['species', 'genushybrid', 'subgenus', 'genus']
+    assert 'min_rank' not in paginator.kwargs and 'max_rank' not in paginator.kwargs
+    assert len(paginator.all()) == 30
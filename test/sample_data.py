@@ -1,32 +1,40 @@
 "Sample responses representing different variations on all supported resource types"
 # flake8: noqa: F401, F403
 import json
-from glob import glob
-from os.path import basename, join, splitext
+from os.path import join
 from typing import Dict
 
 from pyinaturalist.constants import SAMPLE_DATA_DIR
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_sample_data(filename):
     """Load a single sample data file"""
-    with open(join(SAMPLE_DATA_DIR, filename)) as f:
-        return json.load(f)
+    with open(join(SAMPLE_DATA_DIR, filename), 'rb') as f:
+        return orjson.loads(f.read()) if orjson else json.load(f)
+
 
+class LazySampleData(dict):
+    """A dict of sample data that loads each file on first access, instead of loading all files
+    up front
+    """
 
-def load_all_sample_data() -> Dict[str, Dict]:
-    """Load all sample data files"""
-    sample_data = {}
-    for file_path in glob(join(SAMPLE_DATA_DIR, '*.json')):
-        name = splitext(basename(file_path))[0]
-        sample_data[name] = json.load(open(file_path))
-    return sample_data
+    def __missing__(self, name: str) -> Dict:
+        try:
+            self[name] = load_sample_data(f'{name}.json')
+        except FileNotFoundError:
+            raise KeyError(name)
+        return self[name]
 
 
 # Individual JSON records from sample response data
 # --------------------------------------------------
 
-SAMPLE_DATA = load_all_sample_data()
+SAMPLE_DATA = LazySampleData()
 
 j_observation_1 = SAMPLE_DATA['get_observation']['results'][0]
 j_observation_2 = SAMPLE_DATA['get_observations_node_page1']['results'][0]
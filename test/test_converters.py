@@ -1,23 +1,28 @@
 from datetime import datetime
 from io import BytesIO
 from tempfile import NamedTemporaryFile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
-from dateutil.tz import tzoffset
+from dateutil.tz import tzoffset, tzutc
 
 from pyinaturalist.converters import (
+    convert_generic_timestamps,
     convert_lat_long,
     convert_observation_histogram,
     convert_observation_timestamps,
     convert_offset,
+    decode_json,
     ensure_file_obj,
     ensure_list,
     format_dimensions,
     format_file_size,
     format_license,
+    parse_offset,
     safe_split,
+    try_datetime,
 )
+from pyinaturalist.session import MOCK_RESPONSE, get
 from test.conftest import load_sample_data
 
 
@@ -181,6 +186,70 @@ def test_convert_offset__invalid_offset():
     assert convert_offset(datetime(2020, 1, 1), 'invalid') is None
 
 
+def test_parse_offset__cached():
+    tz = parse_offset('GMT-08:00', 'PST')
+    assert tz == tzoffset('PST', -28800)
+    assert parse_offset('GMT-08:00', 'PST') is tz
+    assert parse_offset('GMT-08:00') is not tz
+
+
+def test_convert_generic_timestamps():
+    result = {
+        'id': 1,
+        'created_at': '2020-09-27T14:07:44-07:00',
+        'updated_at': 'Sun, 27 Sep 2020 14:07:44 -0700',
+        'last_post_at': None,
+    }
+    expected_datetime = datetime(2020, 9, 27, 14, 7, 44, tzinfo=tzoffset(None, -25200))
+
+    converted = convert_generic_timestamps(result)
+    assert converted['created_at'] == expected_datetime
+    assert converted['updated_at'] == expected_datetime
+    # ISO timestamps should have the same timezone type as timestamps parsed by dateutil
+    assert type(converted['created_at'].tzinfo) is tzoffset
+    assert type(converted['updated_at'].tzinfo) is tzoffset
+    assert converted['last_post_at'] is None
+
+
+@pytest.mark.parametrize(
+    'timestamp, ignoretz, expected_datetime',
+    [
+        (
+            '2020-09-27T14:07:44-07:00',
+            False,
+            datetime(2020, 9, 27, 14, 7, 44, tzinfo=tzoffset(None, -25200)),
+        ),
+        ('2020-09-27T14:07:44-07:00', True, datetime(2020, 9, 27, 14, 7, 44)),
+        ('2020-09-27T14:07:44+00:00', False, datetime(2020, 9, 27, 14, 7, 44, tzinfo=tzutc())),
+        ('2020-09-27T14:07:44Z', False, datetime(2020, 9, 27, 14, 7, 44, tzinfo=tzutc())),
+        ('2020-09-27 14:07:44', False, datetime(2020, 9, 27, 14, 7, 44)),
+        ('2020-09-27', False, datetime(2020, 9, 27)),
+        (
+            'Sun Sep 27 2020 14:07:44 GMT-0700 (PDT)',
+            False,
+            datetime(2020, 9, 27, 14, 7, 44, tzinfo=tzoffset(None, 25200)),
+        ),
+    ],
+)
+def test_try_datetime__formats(timestamp, ignoretz, expected_datetime):
+    """ISO 8601 timestamps should be parsed with the same timezone types as other formats"""
+    dt = try_datetime(timestamp, ignoretz=ignoretz)
+    assert dt == expected_datetime
+    assert isinstance(dt.tzinfo, type(expected_datetime.tzinfo))
+
+
+def test_try_datetime__partial_iso_date():
+    # Reduced-precision ISO dates should be parsed the same as before, by dateutil.parser.parse
+    assert try_datetime('2020-01') == datetime(2020, 1, datetime.now().day)
+
+
+def test_try_datetime__invalid():
+    assert try_datetime('not a timestamp') is None
+    assert try_datetime(['2020-09-27']) is None
+    assert try_datetime(20200927) is None
+    assert try_datetime(2020.5) is None
+
+
 @pytest.mark.parametrize(
     'input, expected_output',
     [(None, (0, 0)), ((1, 1), (1, 1)), ({"width": 1600, "height": 1200}, (1600, 1200))],
@@ -208,6 +277,29 @@ def test_format_license():
     assert format_license('cc-BY_nC') == 'CC-BY-NC'
 
 
-@pytest.mark.parametrize('input, expected_output', [(None, []), ('a | b', ['a', 'b'])])
+@pytest.mark.parametrize(
+    'input, expected_output',
+    [
+        (None, []),
+        ('', []),
+        ('a', ['a']),
+        ('a | b', ['a', 'b']),
+        (['a', 'b'], ['a', 'b']),
+        (('a', 'b'), ['a', 'b']),
+    ],
+)
 def test_safe_split(input, expected_output):
     assert safe_split(input) == expected_output
+
+
+def test_decode_json(requests_mock):
+    requests_mock.get('https://url', json={'results': [{'id': 1}]})
+    response = get('https://url')
+    assert decode_json(response) == {'results': [{'id': 1}]}
+
+    with patch('pyinaturalist.converters.orjson', None):
+        assert decode_json(response) == {'results': [{'id': 1}]}
+
+
+def test_decode_json__dry_run():
+    assert decode_json(MOCK_RESPONSE) == MOCK_RESPONSE.json()
@@ -10,6 +10,7 @@
 """
 from copy import deepcopy
 from datetime import datetime
+from inspect import Parameter, signature
 
 # flake8: noqa: F405
 import pytest
@@ -78,6 +79,15 @@ def test_copy_collection():
     assert obs_list_1[0].taxon.id != obs_list_2[0].taxon.id
 
 
+@pytest.mark.parametrize(
+    'model', [Identification, Observation, ObservationField, ObservationFieldValue, Taxon, User]
+)
+def test_slots(model):
+    """Models should be slotted classes, without a per-instance __dict__"""
+    assert '__slots__' in model.__dict__
+    assert not hasattr(model(), '__dict__')
+
+
 def test_deduplicate():
     obs_list = Observations.from_json([j_observation_1, j_observation_1, j_observation_2])
     assert len(obs_list) == 3
@@ -172,6 +182,20 @@ def test_comment__str():
 def test_identification__converters():
     identification = ID.from_json(j_identification_3)
     assert isinstance(identification.user, User) and identification.user.id == 2852555
+    assert identification.uuid == j_identification_3['uuid']
+
+
+def test_identification__from_json_list():
+    identifications = ID.from_json_list(
+        [j_identification_1, j_identification_2, j_identification_3, deepcopy(j_identification_3)]
+    )
+    assert isinstance(identifications[0].taxon, Taxon)
+    assert identifications[0].taxon.id == j_identification_1['taxon']['id']
+    assert identifications[1].user.id == j_identification_2['user']['id']
+
+    # Identifications with the same taxon and user should share the same objects
+    assert identifications[2].taxon is identifications[3].taxon
+    assert identifications[2].user is identifications[3].user
 
 
 def test_identification__empty():
@@ -256,9 +280,54 @@ def test_observation__converters():
     assert obs.private_location == (50.0949055, -104.71929167)
 
 
+def test_observation__from_json__original_unmodified():
+    j_observation = deepcopy(j_observation_2)
+    obs = Observation.from_json(j_observation)
+    assert isinstance(obs.created_at, datetime) and isinstance(obs.observed_on, datetime)
+    assert j_observation == j_observation_2
+
+
+def test_observation__from_json_list():
+    obs_list = Observation.from_json_list([j_observation_1, j_observation_2, {'id': 1}])
+    obs_1, obs_2, obs_3 = obs_list
+
+    # Nested objects should already be converted, before being accessed
+    assert isinstance(obs_2._photos[0], Photo) and obs_2._photos[0].id == 92152429
+    assert isinstance(obs_2._identifications[0], ID)
+    assert isinstance(obs_2._taxon, Taxon) and obs_2._taxon.id == 48662
+    assert isinstance(obs_2._user, User) and obs_2._user.id == 2852555
+
+    # Results should be distributed back to the correct observations
+    assert [p.id for p in obs_1.photos] == [p['id'] for p in j_observation_1['photos']]
+    assert [i.id for i in obs_2.identifications] == [
+        i['id'] for i in j_observation_2['identifications']
+    ]
+    assert obs_1.taxon.id == j_observation_1['taxon']['id']
+    assert obs_3.photos == [] and obs_3.taxon is None and obs_3.user is None
+
+
+def test_observation__from_json_list__shared():
+    obs_1, obs_2, obs_3 = Observation.from_json_list(
+        [j_observation_2, deepcopy(j_observation_2), j_observation_1]
+    )
+    assert obs_1.taxon is obs_2.taxon and obs_1.user is obs_2.user
+    assert obs_1.taxon is not obs_3.taxon
+
+    # Identification taxa and users should also be shared across all observations
+    assert obs_1.identifications[0].user is obs_2.identifications[0].user
+
+
+def test_observation__init_signature():
+    """Observation should use the attrs-generated __init__, with explicit (not **kwargs) params"""
+    params = signature(Observation.__init__).parameters
+    assert 'created_at' in params and 'uri' in params
+    assert not any(p.kind == Parameter.VAR_KEYWORD for p in params.values())
+
+
 def test_observation__empty():
     obs = Observation()
     assert isinstance(obs.created_at, datetime)
+    assert obs.uri == f'{INAT_BASE_URL}/observations/'
     assert obs.comments == []
     assert obs.identifications == []
     assert obs.photos == []
@@ -267,6 +336,14 @@ def test_observation__empty():
     assert obs.user is None
 
 
+def test_observation__empty_uri():
+    # A URL should be filled in from the ID, if missing or empty
+    assert Observation(id=5).uri == f'{INAT_BASE_URL}/observations/5'
+    assert Observation(id=5, uri=None).uri == f'{INAT_BASE_URL}/observations/5'
+    assert Observation(id=5, uri='').uri == f'{INAT_BASE_URL}/observations/5'
+    assert Observation(id=5, uri='https://url').uri == 'https://url'
+
+
 def test_observation__with_ofvs():
     obs = Observation.from_json(j_observation_3_ofvs)
     ofv = obs.ofvs[0]
@@ -344,6 +421,12 @@ def test_observation_field_value__empty():
     assert ofv.taxon is None
 
 
+def test_observation_field_value__empty_nested_records():
+    ofv = OFV.from_json({**j_ofv_1_numeric, 'taxon': {}, 'user': {}})
+    assert ofv.taxon is None
+    assert ofv.user is None
+
+
 def test_observation_field_value__str():
     ofv = OFV.from_json(j_ofv_2_taxon)
     assert str(ofv) == 'Feeding on: 119900'
@@ -2,8 +2,8 @@ import pytest
 
 from pyinaturalist.constants import API_V1_BASE_URL
 from pyinaturalist.models import Observation
-from pyinaturalist.paginator import Paginator
-from pyinaturalist.v1 import get_observations
+from pyinaturalist.paginator import Paginator, paginate_all
+from pyinaturalist.v1 import get_observations, get_v1
 from test.sample_data import SAMPLE_DATA
 
 
@@ -50,6 +50,54 @@ async def test_async_iter(requests_mock):
     assert len(observations) == 2
 
 
+@pytest.mark.asyncio
+async def test_async_iter__shared_objects(requests_mock):
+    # Like sync iteration, each page should be converted as a batch, with shared nested objects
+    results = (
+        SAMPLE_DATA['get_observations_node_page1']['results']
+        + SAMPLE_DATA['get_observations_node_page2']['results']
+    )
+    requests_mock.get(
+        f'{API_V1_BASE_URL}/observations',
+        json={'results': results, 'total_results': 2},
+        status_code=200,
+    )
+
+    paginator = Paginator(get_observations, Observation)
+    observations = [obs async for obs in paginator]
+    assert len(observations) == 2
+    assert observations[0].taxon is observations[1].taxon
+
+
+def test_iter__page_parallel(requests_mock):
+    page_results = [[{'id': 1}, {'id': 2}], [{'id': 3}, {'id': 4}], [{'id': 5}]]
+    for page, results in enumerate(page_results, start=1):
+        requests_mock.get(
+            f'{API_V1_BASE_URL}/identifications?page={page}',
+            json={'results': results, 'total_results': 5},
+        )
+
+    response = paginate_all(get_v1, 'identifications', method='page-parallel', per_page=2)
+    assert [r['id'] for r in response['results']] == [1, 2, 3, 4, 5]
+    assert requests_mock.call_count == 3
+
+
+def test_iter__page_parallel_with_limit(requests_mock):
+    for page in range(1, 4):
+        requests_mock.get(
+            f'{API_V1_BASE_URL}/identifications?page={page}',
+            json={'results': [{'id': page * 10 + i} for i in range(2)], 'total_results': 6},
+        )
+
+    paginator = Paginator(
+        get_v1, None, 'identifications', method='page-parallel', per_page=2, limit=3
+    )
+    results = paginator.next_page() + paginator.next_page()
+    assert [r['id'] for r in results] == [10, 11, 20]
+    assert paginator.exhausted is True
+    assert requests_mock.call_count == 2
+
+
 def test_count(requests_mock):
     requests_mock.get(
         f'{API_V1_BASE_URL}/observations?per_page=0', json={'results': [], 'total_results': 50}
@@ -37,3 +37,31 @@ def test_get_identifications_by_id(requests_mock):
 
     response = get_identifications_by_id(155554373)
     assert response['results'][0]['id'] == 155554373
+
+
+def test_get_identifications_by_id__multiple(requests_mock):
+    # Multiple IDs should be combined into a single request
+    requests_mock.get(
+        f'{API_V1_BASE_URL}/identifications/155554373,155043569',
+        json=load_sample_data('get_identifications.json'),
+        status_code=200,
+    )
+
+    response = get_identifications_by_id([155554373, 155043569])
+    assert len(response['results']) == 2
+    assert requests_mock.call_count == 1
+
+
+def test_get_identifications__all_pages(requests_mock):
+    # Pages after the first should be fetched concurrently, and combined in page order
+    results = load_sample_data('get_identifications.json')['results']
+    for page in range(1, 4):
+        requests_mock.get(
+            f'{API_V1_BASE_URL}/identifications?page={page}',
+            json={'results': [{**results[0], 'id': page}], 'total_results': 3},
+            status_code=200,
+        )
+
+    response = get_identifications(page='all', per_page=1)
+    assert [r['id'] for r in response['results']] == [1, 2, 3]
+    assert requests_mock.call_count == 3
@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest.mock import patch
 
 from dateutil.tz import tzutc
 
@@ -35,3 +36,16 @@ def test_get_users_autocomplete(requests_mock):
     assert first_result['id'] == 886482
     assert first_result['login'] == 'niconoe'
     assert first_result['created_at'] == datetime(2018, 4, 23, 17, 11, 14, tzinfo=tzutc())
+
+
+@patch('pyinaturalist.converters.orjson', None)
+def test_get_users_autocomplete__without_orjson(requests_mock):
+    requests_mock.get(
+        f'{API_V1_BASE_URL}/users/autocomplete',
+        json=load_sample_data('get_users_autocomplete.json'),
+        status_code=200,
+    )
+
+    response = get_users_autocomplete(q='niconoe')
+    assert len(response['results']) == response['total_results'] == 3
+    assert response['results'][0]['created_at'] == datetime(2018, 4, 23, 17, 11, 14, tzinfo=tzutc())